@@ -655,3 +655,142 @@ class CombinedScene(Scene):
     def construct(self):
         NeuralNetworkToMatrix.construct(self)
         GradientCalculation.construct(self)
+
+class HeadlessMixin:
+    # A mixin rather than a Scene subclass, so manim doesn't list it as a
+    # renderable scene. layout() combines it with the scene being laid out.
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.renderer.skip_animations = True
+        self.timeline = []
+        self.elapsed = 0.0
+
+    def play(self, *args, **kwargs):
+        # Same bookkeeping as Scene.play, minus the renderer: every animation
+        # jumps straight to its final state and nothing is rasterized.
+        # Scene.begin_animations is skipped on purpose: under Cairo it captures
+        # a static frame, which is exactly the rasterization we want to avoid.
+        self.compile_animation_data(*args, **kwargs)
+        for anim in self.animations:
+            anim._setup_scene(self)
+            anim.begin()
+        self.play_internal(skip_rendering=True)
+        self.timeline.append({
+            "start": self.elapsed,
+            "run_time": float(self.duration),
+            "animations": [
+                {
+                    "type": type(anim).__name__,
+                    "mobject": describe_mobject(mob, recurse=False),
+                    "ref": mob,
+                }
+                for played in self.animations
+                for anim, mob in animated_mobjects(played)
+            ],
+        })
+        self.elapsed += float(self.duration)
+
+def animated_mobjects(anim):
+    # AnimationGroup wraps its members' mobjects in a throwaway Group, so
+    # report the animations inside it instead.
+    if hasattr(anim, "animations"):
+        for sub in anim.animations:
+            yield from animated_mobjects(sub)
+    # ReplacementTransform and friends leave the target on screen, not the source.
+    elif getattr(anim, "replace_mobject_with_target_in_scene", False):
+        yield anim, anim.target_mobject
+    else:
+        yield anim, anim.mobject
+
+def describe_mobject(mob, recurse=True):
+    data = {
+        "type": type(mob).__name__,
+        "center": [round(float(v), 4) for v in mob.get_center()],
+        "width": round(float(mob.width), 4),
+        "height": round(float(mob.height), 4),
+        "color": str(mob.get_color()),
+    }
+    # Text and tex are leaves: their submobjects are glyph paths whose
+    # geometry depends on the installed fonts and TeX distribution.
+    if hasattr(mob, "tex_string"):
+        data["tex"] = mob.tex_string
+    elif hasattr(mob, "text"):
+        data["text"] = mob.text
+    elif recurse and mob.submobjects:
+        data["submobjects"] = [describe_mobject(sub) for sub in mob.submobjects]
+    return data
+
+def describe_timeline(timeline, mobjects):
+    # Each animated mobject is summarised as it looked when its animation
+    # ended, plus its index in the final mobject list (None once it has
+    # left the screen or when it only lives inside a group).
+    indices = {id(mob): i for i, mob in enumerate(mobjects)}
+    return [
+        {
+            **entry,
+            "animations": [
+                {
+                    "type": anim["type"],
+                    "mobject": anim["mobject"],
+                    "index": indices.get(id(anim["ref"])),
+                }
+                for anim in entry["animations"]
+            ],
+        }
+        for entry in timeline
+    ]
+
+def layout(scene_class=None):
+    """Run scene_class.construct without rendering or encoding.
+
+    Returns the final mobject geometry and the animation timeline as plain
+    data, so layouts can be asserted on and construction profiled on its own.
+    GradientCalculation expects the network left on screen by
+    NeuralNetworkToMatrix, so use CombinedScene to lay it out.
+
+        result = layout(CombinedScene)
+        labels = [m for m in result["mobjects"] if m.get("text") == "Input Layer"]
+        assert labels and labels[0]["center"][0] < 0
+    """
+    scene_class = scene_class or CombinedScene
+    if scene_class is GradientCalculation:
+        raise ValueError(
+            "GradientCalculation starts from the network drawn by "
+            "NeuralNetworkToMatrix; lay it out with CombinedScene instead"
+        )
+    headless_class = type(f"Headless{scene_class.__name__}", (HeadlessMixin, scene_class), {})
+    # A tiny pixel array: the camera is never asked to draw anything.
+    with tempconfig({
+        "dry_run": True,
+        "progress_bar": "none",
+        "disable_caching": True,
+        "pixel_width": 16,
+        "pixel_height": 9,
+    }):
+        scene = headless_class()
+        scene.setup()
+        scene.construct()
+        return {
+            "scene": scene_class.__name__,
+            "duration": scene.elapsed,
+            "mobjects": [describe_mobject(mob) for mob in scene.mobjects],
+            "timeline": describe_timeline(scene.timeline, scene.mobjects),
+        }
+
+if __name__ == "__main__":
+    import json
+    import sys
+
+    usage = "usage: python nn.py --headless [SceneName]"
+    if len(sys.argv) < 2 or sys.argv[1] != "--headless":
+        sys.exit(usage)
+    scene_class = globals().get(sys.argv[2]) if len(sys.argv) > 2 else CombinedScene
+    if not (isinstance(scene_class, type) and issubclass(scene_class, Scene)
+            and scene_class.__module__ == __name__):
+        sys.exit(f"unknown scene {sys.argv[2]!r}\n{usage}")
+    try:
+        result = layout(scene_class)
+    except ValueError as error:
+        sys.exit(str(error))
+    json.dump(result, sys.stdout, indent=2)
+    print()